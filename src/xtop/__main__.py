@@ -1,8 +1,6 @@
-import curses
 from .xtopUtil import getOS
 from . import __version__
 import sys
-import argparse
 
 
 def main():
@@ -10,6 +8,13 @@ def main():
         print(f"Only Linux is supported for now. Current OS: {getOS()}")
         return
 
+    # answer --version without paying for argparse and curses
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        print(f"xtop version: {__version__}")
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(prog="xtop", description="xpu information viewer")
     parser.add_argument("-g", "--gpu", action="store_true", help="Show GPU information")
     parser.add_argument("-n", "--npu", action="store_true", help="Show NPU information")
@@ -19,9 +24,11 @@ def main():
     args = parser.parse_args()
 
     if args.gpu:
+        import curses
         from .frontend import GPU_UI
         curses.wrapper(GPU_UI, args.log)
     elif args.npu:
+        import curses
         from .frontend import NPU_UI
         curses.wrapper(NPU_UI, args.log)
     else:
@@ -30,4 +37,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
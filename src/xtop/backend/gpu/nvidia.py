@@ -1,14 +1,44 @@
+import threading
 import pynvml
+from ..sampler import Sampler
+
+
+_GetUtil = pynvml.nvmlDeviceGetUtilizationRates
+_GetMem = pynvml.nvmlDeviceGetMemoryInfo
+
+# NVML is process wide, every NvidiaGPU shares one nvmlInit/nvmlShutdown pair
+_nvml_lock = threading.Lock()
+_nvml_refs = 0
+
+
+def _nvmlAcquire():
+    global _nvml_refs
+    with _nvml_lock:
+        if _nvml_refs == 0:
+            pynvml.nvmlInit()
+        _nvml_refs += 1
+
+
+def _nvmlRelease():
+    global _nvml_refs
+    with _nvml_lock:
+        _nvml_refs -= 1
+        if _nvml_refs == 0:
+            pynvml.nvmlShutdown()
 
 
 class GPUStats:
-    def __init__(self, gpu_id: int, name: str):
+    def __init__(self, gpu_id: int, name: str, handle=None):
         self.gpu_id: int = gpu_id
         self.name: str = name
+        # id and name never change, format the title once
+        self._title: str = f"Device: {gpu_id} {name}"
+        self.handle = handle
         self.utilization = None
         self.memory_used = None
         self.memory_total = None
         self.memory_free = None
+        self.sample_time = None
 
     def update(self, utilization, memory_used, memory_total, memory_free):
         self.utilization = utilization
@@ -17,38 +47,71 @@ class GPUStats:
         self.memory_free = memory_free
 
     def getTitle(self):
-        return f"Device: {self.gpu_id} {self.name}"
+        return self._title
 
     def getData(self):
         return f"Utilization: {self.utilization}% Memory Used: {self.memory_used:.2f}MB / {self.memory_total:.2f}MB"
 
 
-class NvidiaGPU:
+class NvidiaGPU(Sampler):
     def __init__(self):
+        super().__init__()
         self.gpu_number: int = 0
         self.gpus: list[GPUStats] = []
         self.start: bool = False
+        self._max_interval: float = 5.0
+        self._idle_count: int = 0
 
     def init(self):
-        pynvml.nvmlInit()
-        self.gpu_number = pynvml.nvmlDeviceGetCount()
-        for i in range(self.gpu_number):
-            name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(i))
-            gpu = GPUStats(i, name)
-            self.gpus.append(gpu)
+        _nvmlAcquire()
+        try:
+            self.gpu_number = pynvml.nvmlDeviceGetCount()
+            for i in range(self.gpu_number):
+                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+                name = pynvml.nvmlDeviceGetName(handle)
+                gpu = GPUStats(i, name, handle)
+                self.gpus.append(gpu)
+        except BaseException:
+            # shutdown() only releases a started instance, drop the reference here
+            _nvmlRelease()
+            raise
         self.start = True
 
     def shutdown(self):
-        pynvml.nvmlShutdown()
+        self.stop_sampler()
+        if self.start:
+            _nvmlRelease()
         self.start = False
 
     def update(self):
         for gpu in self.gpus:
-            handle = pynvml.nvmlDeviceGetHandleByIndex(gpu.gpu_id)
-            utilization = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
-            mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            handle = gpu.handle
+            utilization = _GetUtil(handle).gpu
+            mem_info = _GetMem(handle)
             mem_used = mem_info.used / (1024 ** 2)
             mem_total = mem_info.total / (1024 ** 2)
             mem_free = mem_info.free / (1024 ** 2)
             gpu.update(utilization, mem_used, mem_total, mem_free)
 
+    def start_sampler(self, interval=0.5, max_interval=5.0):
+        """
+        Start polling NVML from a daemon thread.
+        While every GPU stays idle the period doubles up to max_interval, any load resets it.
+        :param interval: float, seconds between two samples.
+        :param max_interval: float, longest period used while idle.
+        """
+        self._max_interval = max_interval
+        self._idle_count = 0
+        super().start_sampler(interval)
+
+    def _devices(self):
+        return self.gpus
+
+    def _next_interval(self, interval, current_interval):
+        if any(gpu.utilization for gpu in self.gpus):
+            self._idle_count = 0
+            return interval
+        self._idle_count += 1
+        if self._idle_count > 5:
+            return min(current_interval * 2, self._max_interval)
+        return current_interval
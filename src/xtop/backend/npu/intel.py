@@ -1,4 +1,6 @@
 from pypci import PCI
+from ..sampler import Sampler
+import os
 import time
 
 
@@ -7,12 +9,15 @@ class NPUStats:
         self.PCI_Device = pci_device
         self.npu_id: int = npu_id
         self.name: str = name
+        self._title: str = f"Device: {npu_id} {name}"
         self.utilization = None
         self.memory_used = None
         self.memory_total = None
         self.memory_free = None
+        self.sample_time = None
         self.last_busy_time_us = 0
         self.last_busy_time_timestamp = 0
+        self.busy_time_fd = None
 
     def update(self, utilization, memory_used, memory_total, memory_free):
         self.utilization = utilization
@@ -21,14 +26,15 @@ class NPUStats:
         self.memory_free = memory_free
 
     def getTitle(self):
-        return f"Device: {self.npu_id} {self.name}"
+        return self._title
 
     def getData(self):
-        return f"Utilization: {self.utilization}%"
+        return f"Utilization: {self.utilization:.2f}%"
 
 
-class IntelNPU:
+class IntelNPU(Sampler):
     def __init__(self):
+        super().__init__()
         self.npu_number: int = 0
         self.npus: list[NPUStats] = []
         self.start: bool = False
@@ -37,33 +43,46 @@ class IntelNPU:
         npu_devices = PCI().FindAllNPU()
         self.npu_number = len(npu_devices)
         for i in range(self.npu_number):
-            self.npus.append(NPUStats(npu_devices[i], i, f"{npu_devices[i].vendor_name} {npu_devices[i].device_name}"))
+            npu = NPUStats(npu_devices[i], i, f"{npu_devices[i].vendor_name} {npu_devices[i].device_name}")
+            # keep the sysfs file open and re-read it with pread on every tick
+            try:
+                npu.busy_time_fd = os.open(npu_devices[i].path / "npu_busy_time_us", os.O_RDONLY)
+            except OSError as e:
+                # close the fds opened for the devices before this one
+                self.shutdown()
+                raise RuntimeError("Unable to read busy time") from e
+            self.npus.append(npu)
+        self.start = True
 
     def shutdown(self):
-        pass
+        self.stop_sampler()
+        for device in self.npus:
+            if device.busy_time_fd is not None:
+                os.close(device.busy_time_fd)
+                device.busy_time_fd = None
+        self.start = False
 
     def update(self):
         for device in self.npus:
             device.utilization = self.__getUtilization(device)
 
+    def _devices(self):
+        return self.npus
+
     def __getUtilization(self, device: NPUStats):
-        new_timestamp = int(time.time() * 1000)
-        try:
-            new_busy_time = int(self.__read_device_int(device.PCI_Device.path, "npu_busy_time_us"))
-        except FileNotFoundError:
-            raise RuntimeError("Unable to read busy time")
+        new_timestamp = time.monotonic_ns()
+        new_busy_time = self.__pread_int(device.busy_time_fd)
 
         delta_timestamp = new_timestamp - device.last_busy_time_timestamp
         delta_busy_time = new_busy_time - device.last_busy_time_us
 
         device.last_busy_time_timestamp = new_timestamp
         device.last_busy_time_us = new_busy_time
-        utilization = (delta_busy_time / delta_timestamp) / 1000.0 if delta_timestamp > 0 else 0.0
+        # busy time is in us and the timestamp in ns: x1000 to ns, x100 to percent, then the only float division
+        utilization = (delta_busy_time * 100_000) / delta_timestamp if delta_timestamp > 0 else 0.0
 
-        return round(utilization, 2)
+        return utilization
 
     @staticmethod
-    def __read_device_int(device_path, filename):
-        path = device_path / filename
-        with open(path) as f:
-            return int(f.read().strip())
+    def __pread_int(fd):
+        return int(os.pread(fd, 32, 0))
@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+import copy
+import threading
+import time
+
+
+class Sampler(ABC):
+    """
+    Base class for backends that poll update() from a daemon thread so the UI never waits on the hardware.
+    Subclasses implement update() and _devices(), and may override _next_interval().
+    """
+    def __init__(self):
+        self._latest: list = []
+        self._sampler = None
+        self._stop_sampling = threading.Event()
+        self._error = None
+
+    def start_sampler(self, interval=0.5):
+        """
+        Take a first sample and start the sampler thread.
+        :param interval: float, seconds between two samples.
+        """
+        self.update()
+        self._error = None
+        self._publish(time.time())
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, args=(interval,), daemon=True)
+        self._sampler.start()
+
+    def stop_sampler(self):
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def snapshot(self):
+        """
+        Get the latest sample taken by the sampler thread, re-raise the error that stopped it if any.
+        :return: list, one copy per device stamped with sample_time, a new list object for every sample.
+        """
+        if self._error is not None:
+            raise self._error
+        return self._latest
+
+    @abstractmethod
+    def update(self):
+        """
+        Refresh the device objects in place.
+        """
+
+    @abstractmethod
+    def _devices(self):
+        """
+        :return: list, the live device objects refreshed by update().
+        """
+
+    def _next_interval(self, interval, current_interval):
+        """
+        Choose the wait before the next sample, called after every successful sample.
+        :param interval: float, the interval start_sampler was called with.
+        :param current_interval: float, the wait used before this sample.
+        :return: float, seconds to wait before the next sample.
+        """
+        return interval
+
+    def _publish(self, sample_time):
+        latest = [copy.copy(device) for device in self._devices()]
+        for device in latest:
+            device.sample_time = sample_time
+        # a single attribute store is atomic, readers see either the old or the new list
+        self._latest = latest
+
+    def _sample_loop(self, interval):
+        current_interval = interval
+        # waiting on the event instead of sleeping lets stop_sampler return immediately
+        while not self._stop_sampling.wait(current_interval):
+            try:
+                self.update()
+            except Exception as e:
+                # hand the error to the UI thread through snapshot() instead of dying silently
+                self._error = e
+                return
+            self._publish(time.time())
+            current_interval = self._next_interval(interval, current_interval)
@@ -1,6 +1,13 @@
-from .gpu import GPU_UI
-from .npu import NPU_UI
+__all__ = ["GPU_UI", "NPU_UI"]
 
 
-__all__ = ["GPU_UI", "NPU_UI"]
+def __getattr__(name):
+    # import each UI on first use so starting one never loads the other backend
+    if name == "GPU_UI":
+        from .gpu import GPU_UI
+        return GPU_UI
+    if name == "NPU_UI":
+        from .npu import NPU_UI
+        return NPU_UI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -0,0 +1,104 @@
+import curses
+import time
+import os
+
+
+def run_ui(stdscr, backend, devices_attr, label, fmt_row, enable_log=False, refresh_ms=500, sampler_kwargs=None):
+    """
+    Run the curses loop shared by the device UIs until 'q' is pressed, then shut the backend down.
+    :param stdscr: curses window given by curses.wrapper.
+    :param backend: an initialized Sampler backend, e.g. NvidiaGPU or IntelNPU.
+    :param devices_attr: str, name of the backend attribute listing its devices.
+    :param label: str, device kind shown in the header and used in log file names, e.g. "GPU".
+    :param fmt_row: callable, formats the logged value of one device snapshot.
+    :param enable_log: bool, append one CSV row per device and sample under ~/xtop.
+    :param refresh_ms: int, sampling period and getch timeout in milliseconds.
+    :param sampler_kwargs: dict, extra keyword arguments for backend.start_sampler.
+    """
+    log_files = []
+    log_messages = []
+    try:
+        curses.curs_set(0)
+        stdscr.nodelay(True)
+        stdscr.timeout(refresh_ms)
+
+        if enable_log:
+            message = f"xtop Terminal UI For {label} (Log Enable)"
+        else:
+            message = f"xtop Terminal UI For {label}"
+
+        magic_number = int(time.time())
+        devices = getattr(backend, devices_attr)
+
+        backend.start_sampler(refresh_ms / 1000, **(sampler_kwargs or {}))
+
+        # open every log file once, line buffered so each row reaches the disk right away
+        if enable_log:
+            dir_path = os.path.expanduser("~/xtop")
+            os.makedirs(dir_path, exist_ok=True)
+            log_paths = [f"{dir_path}/{label}{i}_{magic_number}.csv" for i in range(len(devices))]
+            log_messages = [f"File log to {path}" for path in log_paths]
+            for path in log_paths:
+                log_files.append(open(path, "a", buffering=1))
+
+        # compose each frame off-screen and copy the visible part to the terminal in one go,
+        # header plus 3 rows per device (6 with the log line), wide enough for the longest fixed line
+        pad_rows = 3 + len(devices) * (6 if enable_log else 3)
+        fixed_lines = [message] + [device.getTitle() for device in devices]
+        fixed_lines += [" " * 4 + line for line in log_messages]
+        pad = curses.newpad(pad_rows, max([512] + [len(line) + 1 for line in fixed_lines]))
+        pad_height, pad_width = pad.getmaxyx()
+        # getch refreshes stdscr, start it clean so it never paints over the pad
+        stdscr.refresh()
+
+        last_snapshot = None
+        last_clock = None
+        last_size = None
+
+        while True:
+            snapshot = backend.snapshot()
+            new_sample = snapshot is not last_snapshot
+            last_snapshot = snapshot
+
+            # the sampler publishes a new list per sample, log each sample once whatever the frame rate
+            if new_sample:
+                for f, device in zip(log_files, snapshot):
+                    f.write(f"{device.sample_time}, {fmt_row(device)}\n")
+
+            dynamic_data = time.strftime('Time: %Y/%m/%d, %H:%M:%S')
+            size = stdscr.getmaxyx()
+
+            # only redraw for a new sample, a clock tick or a resize, not for every key or timeout
+            if new_sample or dynamic_data != last_clock or size != last_size:
+                if size != last_size:
+                    # a resize touches stdscr, flush it here so getch's implicit refresh never paints over the pad
+                    stdscr.noutrefresh()
+                last_clock = dynamic_data
+                last_size = size
+                height, width = size
+
+                pad.erase()
+
+                pad.addstr(0, 0, message)
+                pad.addstr(1, 0, dynamic_data)
+
+                position_base = 2
+                for i, device in enumerate(snapshot):
+                    pad.addstr(i+position_base, 0, device.getTitle())
+                    pad.addstr(i+position_base+1, 4, device.getData())
+                    if enable_log:
+                        pad.addstr(i + position_base + 2, 4, log_messages[i])
+                        position_base += 3
+
+                    position_base += 2
+
+                pad.noutrefresh(0, 0, 0, 0, min(height, pad_height) - 1, min(width, pad_width) - 1)
+                curses.doupdate()
+
+            key = stdscr.getch()
+            if key == ord('q'):
+                break
+    finally:
+        for f in log_files:
+            f.close()
+        backend.shutdown()